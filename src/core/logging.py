@@ -7,6 +7,7 @@ for better debugging and monitoring capabilities.
 
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -166,17 +167,15 @@ def log_processing_time(func):
     """Decorator to log function processing time."""
     def wrapper(*args, **kwargs):
         logger = logging.getLogger(func.__module__)
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             result = func(*args, **kwargs)
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             logger.info(f"{func.__name__} completed in {processing_time:.2f} seconds")
             return result
         except Exception as e:
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             logger.error(f"{func.__name__} failed after {processing_time:.2f} seconds: {e}")
             raise
     
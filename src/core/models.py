@@ -41,7 +41,7 @@ class DeploymentProvider(Enum):
     RENDER = "render"
 
 
-@dataclass
+@dataclass(slots=True)
 class Statement:
     """A single conversational statement with metadata."""
     content: str
@@ -60,7 +60,7 @@ class Statement:
             raise ValueError("Confidence must be between 0 and 1")
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """A collection of statements forming a conversation."""
     statements: List[Statement]
@@ -86,7 +86,7 @@ class Conversation:
         return [s for s in self.statements if s.statement_type == statement_type]
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemRequirements:
     """Extracted requirements from conversation analysis."""
     functional_requirements: List[str]
@@ -103,7 +103,7 @@ class SystemRequirements:
             raise ValueError("Confidence score must be between 0 and 1")
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemComponent:
     """A component in the system architecture."""
     name: str
@@ -122,7 +122,7 @@ class SystemComponent:
             raise ValueError("Component type cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemArchitecture:
     """Complete system architecture specification."""
     components: List[SystemComponent]
@@ -147,7 +147,7 @@ class SystemArchitecture:
         return [c for c in self.components if c.component_type == component_type]
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedCode:
     """Generated code artifact."""
     language: str
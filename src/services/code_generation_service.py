@@ -3,7 +3,8 @@ Refactored code generation service with improved performance and maintainability
 """
 
 from typing import Dict, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor
+from string import Template
+from types import MappingProxyType
 import asyncio
 
 from src.core.models import SystemArchitecture, GeneratedCode
@@ -13,13 +14,154 @@ from src.core.config import get_config
 from src.interfaces.base import MultiLanguageGenerator
 
 
+# Main application templates, compiled once per process
+_TEMPLATES = MappingProxyType({
+    'python': MappingProxyType({
+        'fastapi': Template('''
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+app = FastAPI(title="$app_name")
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+@app.get("/")
+async def root():
+    return {"message": "Hello from $app_name"}
+
+@app.get("/health")
+async def health():
+    return {"status": "healthy"}
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)
+''')
+    }),
+    'rust': MappingProxyType({
+        'axum': Template('''
+use axum::{
+    routing::get,
+    Router,
+    Json,
+};
+use serde_json::{json, Value};
+use std::net::SocketAddr;
+
+#[tokio::main]
+async fn main() {
+    let app = Router::new()
+        .route("/", get(root))
+        .route("/health", get(health));
+
+    let addr = SocketAddr::from(([0, 0, 0, 0], 3000));
+    println!("Server running on {}", addr);
+    
+    axum::Server::bind(&addr)
+        .serve(app.into_make_service())
+        .await
+        .unwrap();
+}
+
+async fn root() -> Json<Value> {
+    Json(json!({"message": "Hello from $app_name"}))
+}
+
+async fn health() -> Json<Value> {
+    Json(json!({"status": "healthy"}))
+}
+''')
+    })
+})
+
+_PYTHON_COMPONENT_TEMPLATE = Template('''
+"""
+$name component
+Responsibilities: $responsibilities
+"""
+
+class $name:
+    def __init__(self):
+        pass
+    
+    def handle_request(self):
+        return {"message": "Handled by $name"}
+''')
+
+_FRAMEWORKS = MappingProxyType({
+    'python': ('fastapi', 'flask', 'django'),
+    'rust': ('axum', 'warp', 'actix'),
+    'go': ('gin', 'echo', 'fiber'),
+    'typescript': ('express', 'nestjs', 'koa'),
+    'java': ('spring', 'quarkus'),
+    'cpp': ('crow', 'beast')
+})
+
+_DEFAULT_FRAMEWORKS = MappingProxyType({
+    'python': 'fastapi',
+    'rust': 'axum',
+    'go': 'gin',
+    'typescript': 'express',
+    'java': 'spring',
+    'cpp': 'crow'
+})
+
+_MAIN_FILENAMES = MappingProxyType({
+    'python': 'main.py',
+    'rust': 'main.rs',
+    'go': 'main.go',
+    'typescript': 'index.ts',
+    'java': 'Main.java',
+    'cpp': 'main.cpp'
+})
+
+_DEPENDENCIES = MappingProxyType({
+    'python': MappingProxyType({
+        'fastapi': ('fastapi', 'uvicorn', 'pydantic'),
+        'flask': ('flask', 'flask-cors'),
+        'django': ('django', 'djangorestframework')
+    }),
+    'rust': MappingProxyType({
+        'axum': ('axum', 'tokio', 'serde_json'),
+        'warp': ('warp', 'tokio', 'serde_json')
+    }),
+    'go': MappingProxyType({
+        'gin': ('github.com/gin-gonic/gin',),
+        'echo': ('github.com/labstack/echo/v4',)
+    })
+})
+
+_BUILD_COMMANDS = MappingProxyType({
+    'python': (),
+    'rust': ('cargo build --release',),
+    'go': ('go build',),
+    'typescript': ('npm run build',),
+    'java': ('mvn compile',),
+    'cpp': ('make',)
+})
+
+_RUN_COMMANDS = MappingProxyType({
+    'python': ('python main.py',),
+    'rust': ('cargo run',),
+    'go': ('go run main.go',),
+    'typescript': ('npm start',),
+    'java': ('java Main',),
+    'cpp': ('./main',)
+})
+
+
 class CodeGenerationService(LoggerMixin):
     """Enhanced code generation service with parallel processing."""
     
     def __init__(self, generator: MultiLanguageGenerator):
         self.generator = generator
         self.config = get_config()
-        self.executor = ThreadPoolExecutor(max_workers=self.config.max_concurrent_generations)
     
     @log_processing_time
     async def generate_multi_language_code(
@@ -31,37 +173,47 @@ class CodeGenerationService(LoggerMixin):
         
         self.logger.info(f"Generating code for {len(languages)} languages")
         
-        # Create tasks for parallel generation
-        tasks = []
-        for language in languages:
-            if language in self.generator.get_supported_languages():
-                task = self._generate_code_async(architecture, language)
-                tasks.append((language, task))
-            else:
-                self.logger.warning(f"Unsupported language: {language}")
-        
-        # Execute tasks in parallel
+        supported = frozenset(self.generator.get_supported_languages())
         results = {}
-        completed_tasks = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
         
-        for (language, _), result in zip(tasks, completed_tasks):
-            if isinstance(result, Exception):
-                self.logger.error(f"Code generation failed for {language}: {result}")
-                continue
-            results[language] = result
+        if len(languages) == 1 and languages[0] in supported:
+            # A single generation is cheaper in-line than a worker-thread round trip
+            language = languages[0]
+            await asyncio.sleep(0)
+            try:
+                results[language] = self.generator.generate_code(architecture, language)
+            except Exception as e:
+                self.logger.error(f"Code generation failed for {language}: {e}")
+        else:
+            # Generate all supported languages in parallel
+            async with asyncio.TaskGroup() as task_group:
+                for language in languages:
+                    if language in supported:
+                        task_group.create_task(
+                            self._collect_code_async(architecture, language, results),
+                            name=f"codegen-{language}"
+                        )
+                    else:
+                        self.logger.warning(f"Unsupported language: {language}")
         
         self.logger.info(f"Successfully generated code for {len(results)} languages")
         return results
     
+    async def _collect_code_async(
+        self,
+        architecture: SystemArchitecture,
+        language: str,
+        results: Dict[str, GeneratedCode]
+    ) -> None:
+        """Generate code for one language, logging failures instead of cancelling siblings."""
+        try:
+            results[language] = await self._generate_code_async(architecture, language)
+        except Exception as e:
+            self.logger.error(f"Code generation failed for {language}: {e}")
+    
     async def _generate_code_async(self, architecture: SystemArchitecture, language: str) -> GeneratedCode:
         """Generate code asynchronously for a single language."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, 
-            self.generator.generate_code, 
-            architecture, 
-            language
-        )
+        return await asyncio.to_thread(self.generator.generate_code, architecture, language)
 
 
 class EnhancedMultiLanguageGenerator(MultiLanguageGenerator, LoggerMixin):
@@ -70,7 +222,7 @@ class EnhancedMultiLanguageGenerator(MultiLanguageGenerator, LoggerMixin):
     def __init__(self):
         self.config = get_config()
         self.supported_languages = self.config.codegen.supported_languages
-        self.templates = self._load_templates()
+        self._supported_set = frozenset(self.supported_languages)
     
     def generate_code(
         self, 
@@ -80,7 +232,7 @@ class EnhancedMultiLanguageGenerator(MultiLanguageGenerator, LoggerMixin):
     ) -> GeneratedCode:
         """Generate code for specified language and framework."""
         
-        if language not in self.supported_languages:
+        if language not in self._supported_set:
             raise UnsupportedLanguageError(f"Language {language} not supported")
         
         self.logger.info(f"Generating {language} code")
@@ -96,7 +248,7 @@ class EnhancedMultiLanguageGenerator(MultiLanguageGenerator, LoggerMixin):
         dependencies = self._extract_dependencies(language, framework)
         
         # Determine entry point
-        entry_point = self._get_entry_point(language, framework)
+        entry_point = _MAIN_FILENAMES.get(language, 'main.txt')
         
         return GeneratedCode(
             language=language,
@@ -114,15 +266,7 @@ class EnhancedMultiLanguageGenerator(MultiLanguageGenerator, LoggerMixin):
     
     def get_supported_frameworks(self, language: str) -> List[str]:
         """Get supported frameworks for language."""
-        framework_map = {
-            'python': ['fastapi', 'flask', 'django'],
-            'rust': ['axum', 'warp', 'actix'],
-            'go': ['gin', 'echo', 'fiber'],
-            'typescript': ['express', 'nestjs', 'koa'],
-            'java': ['spring', 'quarkus'],
-            'cpp': ['crow', 'beast']
-        }
-        return framework_map.get(language, [])
+        return list(_FRAMEWORKS.get(language, ()))
     
     def validate_code(self, code: GeneratedCode) -> List[str]:
         """Validate generated code."""
@@ -136,85 +280,18 @@ class EnhancedMultiLanguageGenerator(MultiLanguageGenerator, LoggerMixin):
         
         return issues
     
-    def _load_templates(self) -> Dict[str, Dict[str, str]]:
-        """Load code templates."""
-        return {
-            'python': {
-                'fastapi': '''
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
-app = FastAPI(title="{app_name}")
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-@app.get("/")
-async def root():
-    return {{"message": "Hello from {app_name}"}}
-
-@app.get("/health")
-async def health():
-    return {{"status": "healthy"}}
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-'''
-            },
-            'rust': {
-                'axum': '''
-use axum::{{
-    routing::get,
-    Router,
-    Json,
-}};
-use serde_json::{{json, Value}};
-use std::net::SocketAddr;
-
-#[tokio::main]
-async fn main() {{
-    let app = Router::new()
-        .route("/", get(root))
-        .route("/health", get(health));
-
-    let addr = SocketAddr::from(([0, 0, 0, 0], 3000));
-    println!("Server running on {{}}", addr);
-    
-    axum::Server::bind(&addr)
-        .serve(app.into_make_service())
-        .await
-        .unwrap();
-}}
-
-async fn root() -> Json<Value> {{
-    Json(json!({{"message": "Hello from {app_name}"}}))
-}}
-
-async fn health() -> Json<Value> {{
-    Json(json!({{"status": "healthy"}}))
-}}
-'''
-            }
-        }
-    
     def _generate_files(self, architecture: SystemArchitecture, language: str, framework: str) -> Dict[str, str]:
         """Generate code files."""
         files = {}
         
         # Get template
-        template = self.templates.get(language, {}).get(framework, "")
+        template = _TEMPLATES.get(language, {}).get(framework)
         if template:
             app_name = "generated_app"
-            main_content = template.format(app_name=app_name)
+            main_content = template.substitute(app_name=app_name)
             
             # Determine main file name
-            main_file = self._get_main_filename(language)
+            main_file = _MAIN_FILENAMES.get(language, 'main.txt')
             files[main_file] = main_content
         
         # Generate additional files based on components
@@ -228,92 +305,28 @@ async fn health() -> Json<Value> {{
     
     def _get_default_framework(self, language: str) -> str:
         """Get default framework for language."""
-        defaults = {
-            'python': 'fastapi',
-            'rust': 'axum',
-            'go': 'gin',
-            'typescript': 'express',
-            'java': 'spring',
-            'cpp': 'crow'
-        }
-        return defaults.get(language, 'default')
-    
-    def _get_main_filename(self, language: str) -> str:
-        """Get main filename for language."""
-        filenames = {
-            'python': 'main.py',
-            'rust': 'main.rs',
-            'go': 'main.go',
-            'typescript': 'index.ts',
-            'java': 'Main.java',
-            'cpp': 'main.cpp'
-        }
-        return filenames.get(language, 'main.txt')
+        return _DEFAULT_FRAMEWORKS.get(language, 'default')
     
     def _extract_dependencies(self, language: str, framework: str) -> List[str]:
         """Extract dependencies for language/framework."""
-        deps = {
-            'python': {
-                'fastapi': ['fastapi', 'uvicorn', 'pydantic'],
-                'flask': ['flask', 'flask-cors'],
-                'django': ['django', 'djangorestframework']
-            },
-            'rust': {
-                'axum': ['axum', 'tokio', 'serde_json'],
-                'warp': ['warp', 'tokio', 'serde_json']
-            },
-            'go': {
-                'gin': ['github.com/gin-gonic/gin'],
-                'echo': ['github.com/labstack/echo/v4']
-            }
-        }
-        return deps.get(language, {}).get(framework, [])
-    
-    def _get_entry_point(self, language: str, framework: str) -> str:
-        """Get entry point filename."""
-        return self._get_main_filename(language)
+        return list(_DEPENDENCIES.get(language, {}).get(framework, ()))
     
     def _get_build_commands(self, language: str, framework: str) -> List[str]:
         """Get build commands."""
-        commands = {
-            'python': [],
-            'rust': ['cargo build --release'],
-            'go': ['go build'],
-            'typescript': ['npm run build'],
-            'java': ['mvn compile'],
-            'cpp': ['make']
-        }
-        return commands.get(language, [])
+        return list(_BUILD_COMMANDS.get(language, ()))
     
     def _get_run_commands(self, language: str, framework: str) -> List[str]:
         """Get run commands."""
-        commands = {
-            'python': ['python main.py'],
-            'rust': ['cargo run'],
-            'go': ['go run main.go'],
-            'typescript': ['npm start'],
-            'java': ['java Main'],
-            'cpp': ['./main']
-        }
-        return commands.get(language, [])
+        return list(_RUN_COMMANDS.get(language, ()))
     
     def _generate_component_file(self, component, language: str, framework: str) -> Optional[tuple]:
         """Generate file for a component."""
         if language == 'python':
             filename = f"{component.name.lower()}.py"
-            content = f'''
-"""
-{component.name} component
-Responsibilities: {', '.join(component.responsibilities)}
-"""
-
-class {component.name}:
-    def __init__(self):
-        pass
-    
-    def handle_request(self):
-        return {{"message": "Handled by {component.name}"}}
-'''
+            content = _PYTHON_COMPONENT_TEMPLATE.substitute(
+                name=component.name,
+                responsibilities=', '.join(component.responsibilities)
+            )
             return (filename, content)
         
         return None
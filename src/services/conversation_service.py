@@ -6,9 +6,11 @@ error handling, logging, and performance optimizations.
 """
 
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 from src.core.models import (
     Conversation, Statement, SystemRequirements, StatementType, ProcessingResult
@@ -19,13 +21,78 @@ from src.core.config import get_config
 from src.interfaces.base import ConversationalParser
 
 
+# Bound for the per-process entity/classification caches
+_PARSER_CACHE_SIZE = 4096
+
+# Common technical entities recognised by the parser
+TECHNICAL_KEYWORDS = (
+    'api', 'database', 'user', 'authentication', 'authorization',
+    'payment', 'notification', 'email', 'sms', 'file', 'upload',
+    'download', 'search', 'filter', 'sort', 'pagination', 'cache',
+    'session', 'cookie', 'token', 'jwt', 'oauth', 'ssl', 'https',
+    'rest', 'graphql', 'websocket', 'microservice', 'container',
+    'docker', 'kubernetes', 'aws', 'gcp', 'azure'
+)
+
+# Quality attributes tracked across a whole conversation
+QUALITY_ATTRIBUTES = (
+    'performance', 'scalability', 'security', 'reliability', 'usability'
+)
+
+
+# Every keyword the conversation-level scan looks for, de-duplicated
+_CONVERSATION_KEYWORDS = tuple(dict.fromkeys(TECHNICAL_KEYWORDS + QUALITY_ATTRIBUTES))
+
+# Keywords that indicate a clearly structured statement
+_CONFIDENCE_KEYWORDS = ('create', 'build', 'implement', 'need', 'want', 'should', 'must')
+
+# Action verbs that mark a sentence as a functional requirement
+_ACTION_RE = re.compile(
+    'create|build|implement|develop|add|remove|update|delete|manage|handle|process|generate'
+)
+
+# Statement fields that must be populated for processing
+_REQUIRED_STATEMENT_FIELDS = ('content', 'context', 'timestamp', 'speaker', 'statement_type')
+
+# Complexity weight per statement type
+_COMPLEXITY_TYPE_WEIGHTS = {
+    StatementType.FUNCTIONAL.value: 1.0,
+    StatementType.NON_FUNCTIONAL.value: 1.5,
+    StatementType.CONSTRAINT.value: 2.0,
+    StatementType.BUSINESS_RULE.value: 1.2,
+    StatementType.EVOLUTION.value: 2.5
+}
+
+
+@lru_cache(maxsize=_PARSER_CACHE_SIZE)
+def _extract_entities(text: str) -> tuple:
+    """Extract technical entities from text (bounded LRU cache)."""
+    text_lower = text.lower()
+    return tuple(keyword for keyword in TECHNICAL_KEYWORDS if keyword in text_lower)
+
+
+@lru_cache(maxsize=_PARSER_CACHE_SIZE)
+def _classify_content(content: str) -> str:
+    """Classify statement content by keywords (bounded LRU cache)."""
+    content_lower = content.lower()
+    
+    if any(word in content_lower for word in ['create', 'build', 'implement', 'develop']):
+        return 'implementation'
+    elif any(word in content_lower for word in ['performance', 'speed', 'scalability']):
+        return 'performance'
+    elif any(word in content_lower for word in ['security', 'authentication', 'authorization']):
+        return 'security'
+    elif any(word in content_lower for word in ['ui', 'interface', 'design', 'user experience']):
+        return 'interface'
+    return 'general'
+
+
 class ConversationService(LoggerMixin):
     """Service for processing conversations with enhanced capabilities."""
     
     def __init__(self, parser: ConversationalParser):
         self.parser = parser
         self.config = get_config()
-        self.executor = ThreadPoolExecutor(max_workers=self.config.max_concurrent_generations)
     
     @log_processing_time
     def process_conversation(self, conversation: Conversation) -> ProcessingResult:
@@ -38,7 +105,7 @@ class ConversationService(LoggerMixin):
         Returns:
             ProcessingResult with requirements and metadata
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         result = ProcessingResult(
             conversation=conversation,
             requirements=SystemRequirements([], [], [], [], {}, []),
@@ -58,7 +125,7 @@ class ConversationService(LoggerMixin):
             result.requirements = requirements
             
             # Add processing metadata
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             result.processing_time = processing_time
             result.metadata = {
                 "statement_count": len(conversation.statements),
@@ -76,8 +143,7 @@ class ConversationService(LoggerMixin):
     
     async def process_conversation_async(self, conversation: Conversation) -> ProcessingResult:
         """Process conversation asynchronously."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, self.process_conversation, conversation)
+        return await asyncio.to_thread(self.process_conversation, conversation)
     
     def _validate_conversation(self, conversation: Conversation) -> None:
         """Validate conversation structure and content."""
@@ -96,61 +162,64 @@ class ConversationService(LoggerMixin):
     
     def _validate_statement(self, statement: Statement) -> None:
         """Validate individual statement."""
-        if not statement.content.strip():
+        content = statement.content
+        if not content or content.isspace():
             raise StatementParsingError("Statement content is empty")
         
-        if len(statement.content) > 10000:  # Reasonable limit
+        if len(content) > 10000:  # Reasonable limit
             raise StatementParsingError("Statement too long (>10000 characters)")
         
-        # Check for required fields
-        required_fields = ['content', 'context', 'timestamp', 'speaker', 'statement_type']
-        for field in required_fields:
-            if not hasattr(statement, field) or getattr(statement, field) is None:
-                raise StatementParsingError(f"Statement missing required field: {field}")
+        # Check for required fields; only resolve which one on the error path
+        if (statement.context is None or statement.timestamp is None
+                or statement.speaker is None or statement.statement_type is None):
+            missing = next(name for name in _REQUIRED_STATEMENT_FIELDS if getattr(statement, name) is None)
+            raise StatementParsingError(f"Statement missing required field: {missing}")
     
     def analyze_conversation_complexity(self, conversation: Conversation) -> Dict[str, Any]:
         """Analyze conversation complexity for processing optimization."""
-        statement_types = {}
+        analysis, _ = self._summarize(conversation)
+        return analysis
+    
+    def _summarize(
+        self,
+        conversation: Conversation,
+        include_concepts: bool = False
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Compute complexity analysis and, optionally, key concepts in one pass."""
+        statement_types = Counter()
         total_length = 0
+        concepts = {}  # ordered de-duplication
         
         for statement in conversation.statements:
-            stmt_type = statement.statement_type.value
-            statement_types[stmt_type] = statement_types.get(stmt_type, 0) + 1
+            statement_types[statement.statement_type.value] += 1
             total_length += len(statement.content)
+            if include_concepts:
+                # Extract entities using the parser
+                concepts.update(dict.fromkeys(self.parser.extract_entities(statement.content)))
         
-        complexity_score = self._calculate_complexity_score(conversation)
+        statement_count = len(conversation.statements)
+        complexity_score = self._calculate_complexity_score(statement_types, statement_count)
         
-        return {
-            "statement_count": len(conversation.statements),
-            "statement_types": statement_types,
+        analysis = {
+            "statement_count": statement_count,
+            "statement_types": dict(statement_types),
             "total_length": total_length,
-            "average_length": total_length / len(conversation.statements),
+            "average_length": total_length / statement_count,
             "complexity_score": complexity_score,
             "estimated_processing_time": self._estimate_processing_time(complexity_score)
         }
+        return analysis, list(concepts)
     
-    def _calculate_complexity_score(self, conversation: Conversation) -> float:
-        """Calculate complexity score based on conversation characteristics."""
-        score = 0.0
-        
-        # Base score from statement count
-        score += len(conversation.statements) * 0.1
-        
-        # Add complexity for different statement types
-        type_weights = {
-            StatementType.FUNCTIONAL: 1.0,
-            StatementType.NON_FUNCTIONAL: 1.5,
-            StatementType.CONSTRAINT: 2.0,
-            StatementType.BUSINESS_RULE: 1.2,
-            StatementType.EVOLUTION: 2.5
-        }
-        
-        for statement in conversation.statements:
-            weight = type_weights.get(statement.statement_type, 1.0)
-            score += weight
+    def _calculate_complexity_score(self, statement_types: Dict[str, int], statement_count: int) -> float:
+        """Calculate complexity score from per-type statement counts."""
+        # Base score from statement count plus per-type weights
+        score = statement_count * 0.1 + sum(
+            _COMPLEXITY_TYPE_WEIGHTS.get(stmt_type, 1.0) * count
+            for stmt_type, count in statement_types.items()
+        )
         
         # Normalize to 0-10 scale
-        return min(score / len(conversation.statements), 10.0)
+        return min(score / statement_count, 10.0)
     
     def _estimate_processing_time(self, complexity_score: float) -> float:
         """Estimate processing time based on complexity score."""
@@ -160,19 +229,15 @@ class ConversationService(LoggerMixin):
     
     def extract_key_concepts(self, conversation: Conversation) -> List[str]:
         """Extract key concepts from conversation for caching and optimization."""
-        concepts = set()
-        
+        extract_entities = self.parser.extract_entities
+        concepts = {}  # ordered de-duplication, matching _summarize
         for statement in conversation.statements:
-            # Extract entities using the parser
-            entities = self.parser.extract_entities(statement.content)
-            concepts.update(entities)
-        
+            concepts.update(dict.fromkeys(extract_entities(statement.content)))
         return list(concepts)
     
     def get_conversation_summary(self, conversation: Conversation) -> Dict[str, Any]:
         """Generate a comprehensive conversation summary."""
-        analysis = self.analyze_conversation_complexity(conversation)
-        concepts = self.extract_key_concepts(conversation)
+        analysis, concepts = self._summarize(conversation, include_concepts=True)
         
         return {
             "conversation_id": conversation.conversation_id,
@@ -188,8 +253,6 @@ class EnhancedConversationalParser(ConversationalParser, LoggerMixin):
     
     def __init__(self):
         self.config = get_config()
-        self._entity_cache = {}
-        self._classification_cache = {}
     
     def parse_statements(self, conversation: Conversation) -> SystemRequirements:
         """Parse conversation statements into structured requirements."""
@@ -199,115 +262,77 @@ class EnhancedConversationalParser(ConversationalParser, LoggerMixin):
         non_functional_reqs = []
         constraints = []
         business_rules = []
-        entities = set()
         
-        for statement in conversation.statements:
+        # Lowercase each statement once and share it across all extractors
+        lowered = [statement.content.lower() for statement in conversation.statements]
+        
+        for statement, content_lower in zip(conversation.statements, lowered):
             try:
                 # Extract requirements based on statement type
                 if statement.statement_type == StatementType.FUNCTIONAL:
-                    functional_reqs.extend(self._extract_functional_requirements(statement))
+                    functional_reqs.extend(self._extract_functional_requirements(statement, content_lower))
                 elif statement.statement_type == StatementType.NON_FUNCTIONAL:
-                    non_functional_reqs.extend(self._extract_non_functional_requirements(statement))
+                    non_functional_reqs.extend(self._extract_non_functional_requirements(statement, content_lower))
                 elif statement.statement_type == StatementType.CONSTRAINT:
-                    constraints.extend(self._extract_constraints(statement))
+                    constraints.extend(self._extract_constraints(statement, content_lower))
                 elif statement.statement_type == StatementType.BUSINESS_RULE:
-                    business_rules.extend(self._extract_business_rules(statement))
-                
-                # Extract entities
-                statement_entities = self.extract_entities(statement.content)
-                entities.update(statement_entities)
+                    business_rules.extend(self._extract_business_rules(statement, content_lower))
                 
             except Exception as e:
                 self.logger.warning(f"Failed to parse statement: {e}")
                 continue
         
+        # Extract entities and quality attributes in a single pass
+        found_keywords = self._scan_conversation_keywords(lowered)
+        entities = [keyword for keyword in TECHNICAL_KEYWORDS if keyword in found_keywords]
+        
         # Calculate confidence score
-        confidence = self._calculate_parsing_confidence(conversation)
+        confidence = self._calculate_parsing_confidence(conversation, lowered)
         
         return SystemRequirements(
             functional_requirements=functional_reqs,
             non_functional_requirements=non_functional_reqs,
             constraints=constraints,
             business_rules=business_rules,
-            quality_attributes=self._extract_quality_attributes(conversation),
-            extracted_entities=list(entities),
+            quality_attributes=self._extract_quality_attributes(found_keywords),
+            extracted_entities=entities,
             confidence_score=confidence
         )
     
     def extract_entities(self, text: str) -> List[str]:
         """Extract entities from text with caching."""
-        if text in self._entity_cache:
-            return self._entity_cache[text]
-        
         # Simple entity extraction (can be enhanced with NLP libraries)
-        entities = []
-        
-        # Extract common technical entities
-        technical_keywords = [
-            'api', 'database', 'user', 'authentication', 'authorization',
-            'payment', 'notification', 'email', 'sms', 'file', 'upload',
-            'download', 'search', 'filter', 'sort', 'pagination', 'cache',
-            'session', 'cookie', 'token', 'jwt', 'oauth', 'ssl', 'https',
-            'rest', 'graphql', 'websocket', 'microservice', 'container',
-            'docker', 'kubernetes', 'aws', 'gcp', 'azure'
-        ]
-        
-        text_lower = text.lower()
-        for keyword in technical_keywords:
-            if keyword in text_lower:
-                entities.append(keyword)
-        
-        # Cache result
-        self._entity_cache[text] = entities
-        return entities
+        return list(_extract_entities(text))
     
     def classify_statement(self, statement: Statement) -> str:
         """Classify statement with caching."""
-        cache_key = f"{statement.content}_{statement.statement_type.value}"
-        if cache_key in self._classification_cache:
-            return self._classification_cache[cache_key]
-        
-        # Simple classification based on keywords
-        content_lower = statement.content.lower()
-        
-        if any(word in content_lower for word in ['create', 'build', 'implement', 'develop']):
-            classification = 'implementation'
-        elif any(word in content_lower for word in ['performance', 'speed', 'scalability']):
-            classification = 'performance'
-        elif any(word in content_lower for word in ['security', 'authentication', 'authorization']):
-            classification = 'security'
-        elif any(word in content_lower for word in ['ui', 'interface', 'design', 'user experience']):
-            classification = 'interface'
-        else:
-            classification = 'general'
-        
-        # Cache result
-        self._classification_cache[cache_key] = classification
-        return classification
+        return _classify_content(statement.content)
     
-    def _extract_functional_requirements(self, statement: Statement) -> List[str]:
+    def _extract_functional_requirements(
+        self,
+        statement: Statement,
+        content_lower: Optional[str] = None
+    ) -> List[str]:
         """Extract functional requirements from statement."""
         content = statement.content
         requirements = []
         
-        # Look for action verbs and objects
-        action_patterns = [
-            'create', 'build', 'implement', 'develop', 'add', 'remove',
-            'update', 'delete', 'manage', 'handle', 'process', 'generate'
-        ]
+        if content_lower is None:
+            content_lower = content.lower()
         
-        content_lower = content.lower()
-        for pattern in action_patterns:
-            if pattern in content_lower:
-                # Extract the requirement around the action
-                sentences = content.split('.')
-                for sentence in sentences:
-                    if pattern in sentence.lower():
-                        requirements.append(sentence.strip())
+        # Keep each sentence that contains an action verb; lower() never adds
+        # or removes '.', so the original and lowered splits line up
+        for sentence, sentence_lower in zip(content.split('.'), content_lower.split('.')):
+            if _ACTION_RE.search(sentence_lower):
+                requirements.append(sentence.strip())
         
         return requirements if requirements else [content]
     
-    def _extract_non_functional_requirements(self, statement: Statement) -> List[str]:
+    def _extract_non_functional_requirements(
+        self,
+        statement: Statement,
+        content_lower: Optional[str] = None
+    ) -> List[str]:
         """Extract non-functional requirements from statement."""
         content = statement.content
         requirements = []
@@ -318,14 +343,19 @@ class EnhancedConversationalParser(ConversationalParser, LoggerMixin):
             'availability', 'usability', 'maintainability', 'portability'
         ]
         
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
         for pattern in quality_patterns:
             if pattern in content_lower:
                 requirements.append(f"{pattern.title()}: {content}")
         
         return requirements if requirements else [content]
     
-    def _extract_constraints(self, statement: Statement) -> List[str]:
+    def _extract_constraints(
+        self,
+        statement: Statement,
+        content_lower: Optional[str] = None
+    ) -> List[str]:
         """Extract constraints from statement."""
         content = statement.content
         constraints = []
@@ -336,7 +366,8 @@ class EnhancedConversationalParser(ConversationalParser, LoggerMixin):
             'required', 'mandatory', 'forbidden', 'not allowed'
         ]
         
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
         for pattern in constraint_patterns:
             if pattern in content_lower:
                 constraints.append(content)
@@ -344,7 +375,11 @@ class EnhancedConversationalParser(ConversationalParser, LoggerMixin):
         
         return constraints if constraints else [content]
     
-    def _extract_business_rules(self, statement: Statement) -> List[str]:
+    def _extract_business_rules(
+        self,
+        statement: Statement,
+        content_lower: Optional[str] = None
+    ) -> List[str]:
         """Extract business rules from statement."""
         content = statement.content
         rules = []
@@ -355,7 +390,8 @@ class EnhancedConversationalParser(ConversationalParser, LoggerMixin):
             'business rule', 'policy', 'regulation', 'compliance'
         ]
         
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
         for pattern in rule_patterns:
             if pattern in content_lower:
                 rules.append(content)
@@ -363,34 +399,30 @@ class EnhancedConversationalParser(ConversationalParser, LoggerMixin):
         
         return rules if rules else [content]
     
-    def _extract_quality_attributes(self, conversation: Conversation) -> Dict[str, Any]:
-        """Extract quality attributes from conversation."""
-        attributes = {
-            'performance': False,
-            'scalability': False,
-            'security': False,
-            'reliability': False,
-            'usability': False
-        }
-        
-        full_text = ' '.join(stmt.content.lower() for stmt in conversation.statements)
-        
-        for attribute in attributes:
-            if attribute in full_text:
-                attributes[attribute] = True
-        
-        return attributes
+    def _scan_conversation_keywords(self, lowered: List[str]) -> set:
+        """Find all known keywords in the lowercased statements with one scan per keyword."""
+        # Unit separator keeps matches from spanning statement boundaries
+        buffer = '\x1f'.join(lowered)
+        return {keyword for keyword in _CONVERSATION_KEYWORDS if keyword in buffer}
     
-    def _calculate_parsing_confidence(self, conversation: Conversation) -> float:
+    def _extract_quality_attributes(self, found_keywords: set) -> Dict[str, Any]:
+        """Extract quality attributes from keywords found in the conversation."""
+        return {attribute: attribute in found_keywords for attribute in QUALITY_ATTRIBUTES}
+    
+    def _calculate_parsing_confidence(
+        self,
+        conversation: Conversation,
+        lowered: Optional[List[str]] = None
+    ) -> float:
         """Calculate confidence score for parsing results."""
         total_statements = len(conversation.statements)
-        parsed_statements = 0
+        if lowered is None:
+            lowered = [statement.content.lower() for statement in conversation.statements]
         
-        for statement in conversation.statements:
-            # Check if statement has clear structure
-            if any(keyword in statement.content.lower() for keyword in [
-                'create', 'build', 'implement', 'need', 'want', 'should', 'must'
-            ]):
-                parsed_statements += 1
+        # Count statements with clear structure
+        parsed_statements = sum(
+            1 for content_lower in lowered
+            if any(keyword in content_lower for keyword in _CONFIDENCE_KEYWORDS)
+        )
         
         return parsed_statements / total_statements if total_statements > 0 else 0.0
@@ -4,142 +4,328 @@ Caching utilities for the Statement-to-Reality System.
 
 import json
 import hashlib
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
+import heapq
+import itertools
+import time
+from typing import Any, Optional, Dict, List, Tuple
 import pickle
 import os
+from collections import OrderedDict
+from functools import lru_cache
 
 from src.core.logging import LoggerMixin
 from src.interfaces.base import CacheProvider
 
 
+class _Entry:
+    """Cache entry holding a value and its expiry."""
+    __slots__ = ('value', 'expiry')
+    
+    def __init__(self, value: Any, expiry: float):
+        self.value = value
+        self.expiry = expiry
+
+
 class MemoryCache(CacheProvider, LoggerMixin):
-    """In-memory cache implementation."""
+    """In-memory LRU cache implementation with per-entry TTL."""
     
-    def __init__(self, default_ttl: int = 3600):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, default_ttl: int = 3600, max_entries: int = 10000):
+        self.cache: "OrderedDict[str, _Entry]" = OrderedDict()
         self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        # (expiry, insertion sequence, key); the sequence breaks expiry ties so
+        # keys of different types are never compared
+        self._expiry_heap: List[Tuple[float, int, Any]] = []
+        self._seq = itertools.count()
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, _now=time.monotonic) -> Optional[Any]:
         """Get value from cache."""
-        if key in self.cache:
-            entry = self.cache[key]
-            if self._is_expired(entry):
-                del self.cache[key]
-                return None
-            return entry['value']
-        return None
+        cache = self.cache
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if entry.expiry < _now():
+            cache.pop(key, None)
+            return None
+        cache.move_to_end(key)
+        return entry.value
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache."""
         ttl = ttl or self.default_ttl
-        expiry = datetime.now() + timedelta(seconds=ttl)
-        self.cache[key] = {
-            'value': value,
-            'expiry': expiry
-        }
+        now = time.monotonic()
+        expiry = now + ttl
+        cache = self.cache
+        cache[key] = _Entry(value, expiry)
+        cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expiry, next(self._seq), key))
+        self._evict_expired(now)
+        
+        # Bound memory by dropping the least recently used entry
+        if len(cache) > self.max_entries:
+            cache.popitem(last=False)
     
     def delete(self, key: str) -> None:
         """Delete value from cache."""
-        if key in self.cache:
-            del self.cache[key]
+        self.cache.pop(key, None)
     
     def clear(self) -> None:
         """Clear all cache entries."""
         self.cache.clear()
+        self._expiry_heap.clear()
     
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
-        """Check if cache entry is expired."""
-        return datetime.now() > entry['expiry']
+    def _evict_expired(self, now: float) -> None:
+        """Drop expired entries that were never read back, oldest first."""
+        cache = self.cache
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expiry, _, key = heapq.heappop(heap)
+            entry = cache.get(key)
+            # Skip heap items left behind by an overwrite or delete
+            if entry is not None and entry.expiry == expiry:
+                del cache[key]
+        
+        # Overwrites leave stale items behind; rebuild once they dominate
+        if len(heap) > 2 * len(cache) + 64:
+            seq = self._seq
+            self._expiry_heap = [(entry.expiry, next(seq), key) for key, entry in cache.items()]
+            heapq.heapify(self._expiry_heap)
+
+
+class _BloomFilter:
+    """Bloom filter over 16-byte key digests (~1% false positives at capacity)."""
+    __slots__ = ('bits', 'size', 'hashes')
+    
+    def __init__(self, capacity: int, hashes: int = 7):
+        # ~9.6 bits per entry gives a 1% false-positive rate with 7 hashes
+        self.size = max(64, int(capacity * 9.6))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.hashes = hashes
+    
+    def _positions(self, digest: bytes):
+        # Double hashing from the two halves of the digest
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        size = self.size
+        return ((h1 + i * h2) % size for i in range(self.hashes))
+    
+    def add(self, digest: bytes) -> None:
+        bits = self.bits
+        for pos in self._positions(digest):
+            bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest))
 
 
 class FileCache(CacheProvider, LoggerMixin):
-    """File-based cache implementation."""
+    """File-based cache implementation.
+    
+    With ``negative_cache=True`` a Bloom filter of known keys answers misses
+    without touching the filesystem. Only enable it when this instance is the
+    sole writer: entries written by other instances or processes after startup
+    read as misses.
+    """
     
-    def __init__(self, cache_dir: str = ".cache", default_ttl: int = 3600):
+    def __init__(self, cache_dir: str = ".cache", default_ttl: int = 3600,
+                 expected_entries: int = 10000, negative_cache: bool = False):
         self.cache_dir = cache_dir
         self.default_ttl = default_ttl
+        self.expected_entries = expected_entries
+        self.negative_cache = negative_cache
+        self._known: Optional[_BloomFilter] = None
         os.makedirs(cache_dir, exist_ok=True)
+        if negative_cache:
+            self._load_known_keys()
+    
+    def _load_known_keys(self) -> None:
+        """Seed the negative-lookup filter from the files already on disk."""
+        self._known = _BloomFilter(self.expected_entries)
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext == '.cache' and entry.is_file():
+                    try:
+                        self._known.add(bytes.fromhex(stem))
+                    except ValueError:
+                        continue
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        file_path = self._get_file_path(key)
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'rb') as f:
-                    entry = pickle.load(f)
-                if self._is_expired(entry):
-                    os.remove(file_path)
-                    return None
-                return entry['value']
-            except Exception as e:
-                self.logger.warning(f"Failed to read cache file {file_path}: {e}")
+        digest = self._digest(key)
+        # With the negative cache, keys never seen here skip the filesystem
+        known = self._known
+        if known is not None and digest not in known:
+            return None
+        
+        file_path = self._path_for(digest)
+        try:
+            with open(file_path, 'rb') as f:
+                entry = pickle.loads(f.read())
+            if self._is_expired(entry):
+                os.remove(file_path)
+                return None
+            return entry['value']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Failed to read cache file {file_path}: {e}")
         return None
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache."""
         ttl = ttl or self.default_ttl
-        expiry = datetime.now() + timedelta(seconds=ttl)
         entry = {
             'value': value,
-            'expiry': expiry
+            'expiry': time.time() + ttl  # wall clock: entries outlive the process
         }
         
-        file_path = self._get_file_path(key)
+        digest = self._digest(key)
+        file_path = self._path_for(digest)
         try:
             with open(file_path, 'wb') as f:
-                pickle.dump(entry, f)
+                pickle.dump(entry, f, protocol=5)
+            if self._known is not None:
+                self._known.add(digest)
         except Exception as e:
             self.logger.warning(f"Failed to write cache file {file_path}: {e}")
     
     def delete(self, key: str) -> None:
         """Delete value from cache."""
-        file_path = self._get_file_path(key)
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        try:
+            os.remove(self._get_file_path(key))
+        except FileNotFoundError:
+            pass
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        for filename in os.listdir(self.cache_dir):
-            file_path = os.path.join(self.cache_dir, filename)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.remove(entry.path)
+        if self.negative_cache:
+            self._known = _BloomFilter(self.expected_entries)
+    
+    def _digest(self, key: str) -> bytes:
+        """Get the 16-byte digest naming a key's cache file."""
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+    
+    def _path_for(self, digest: bytes) -> str:
+        """Get file path for a key digest."""
+        return os.path.join(self.cache_dir, f"{digest.hex()}.cache")
     
     def _get_file_path(self, key: str) -> str:
         """Get file path for cache key."""
-        safe_key = hashlib.md5(key.encode()).hexdigest()
-        return os.path.join(self.cache_dir, f"{safe_key}.cache")
+        return self._path_for(self._digest(key))
     
     def _is_expired(self, entry: Dict[str, Any]) -> bool:
         """Check if cache entry is expired."""
-        return datetime.now() > entry['expiry']
+        return entry['expiry'] < time.time()
+
+
+class _CachedNone:
+    """Stand-in stored by @cached for a None result, so it reads back as a hit."""
+    __slots__ = ()
+    
+    def __reduce__(self):
+        # Pickle by reference so FileCache round-trips the singleton
+        return '_CACHED_NONE'
+
+
+_CACHED_NONE = _CachedNone()
+
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 def create_cache_key(*args, **kwargs) -> str:
     """Create a cache key from arguments."""
-    key_data = {
-        'args': args,
-        'kwargs': kwargs
-    }
-    key_str = json.dumps(key_data, sort_keys=True, default=str)
-    return hashlib.sha256(key_str.encode()).hexdigest()
+    scalar = _SCALAR_TYPES
+    if all(type(a) in scalar for a in args) and all(type(v) in scalar for v in kwargs.values()):
+        return _scalar_cache_key(*args, **kwargs)
+    return _digest_arguments(args, kwargs)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _scalar_cache_key(*args, **kwargs) -> str:
+    """Memoized key for all-scalar arguments (typed, so 1, 1.0 and True stay distinct)."""
+    return _digest_arguments(args, kwargs)
+
+
+def _canonical(value: Any) -> Any:
+    """Rebuild containers in a fixed order so equal arguments pickle identically."""
+    kind = type(value)
+    if kind in _SCALAR_TYPES:
+        return value
+    if isinstance(value, dict):
+        return (kind, _sorted_tuple((_canonical(k), _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return (kind, _sorted_tuple(_canonical(v) for v in value))
+    if isinstance(value, (list, tuple)):
+        return (kind, tuple(_canonical(v) for v in value))
+    return value
+
+
+def _sorted_tuple(items) -> tuple:
+    """Sort items, falling back to their reprs when they are not mutually orderable."""
+    items = list(items)
+    try:
+        return tuple(sorted(items))
+    except TypeError:
+        return tuple(sorted(items, key=repr))
+
+
+def _digest_arguments(args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Hash the pickled arguments into a hex key."""
+    try:
+        # Dicts and sets are canonicalized first: pickle preserves their
+        # iteration order, so equal mappings would otherwise get different keys
+        key_data = (_canonical(args), tuple(sorted((k, _canonical(v)) for k, v in kwargs.items())))
+        key_bytes = pickle.dumps(key_data, protocol=5)
+    except Exception:
+        # Unpicklable arguments fall back to their string representation
+        key_bytes = json.dumps(
+            {'args': args, 'kwargs': kwargs}, sort_keys=True, default=str
+        ).encode()
+    return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
 
 
 def cached(cache_provider: CacheProvider, ttl: int = 3600):
     """Decorator for caching function results."""
+    # MemoryCache only needs hashable keys, so all-scalar arguments can skip
+    # the pickle-and-digest derivation and key on the argument tuple itself.
+    # Anything nested goes through create_cache_key: tuple keys compare with ==,
+    # which would conflate (1,), (True,) and (1.0,) and keep the arguments alive.
+    in_memory = isinstance(cache_provider, MemoryCache)
+    scalar = _SCALAR_TYPES
+    get = cache_provider.get
+    set_ = cache_provider.set
+    
     def decorator(func):
+        func_name = func.__name__
+        
         def wrapper(*args, **kwargs):
             # Create cache key
-            cache_key = f"{func.__name__}_{create_cache_key(*args, **kwargs)}"
+            if (in_memory and all(type(a) in scalar for a in args)
+                    and all(type(v) in scalar for v in kwargs.values())):
+                # Argument types are part of the key so 1, 1.0 and True stay distinct
+                items = tuple(sorted(kwargs.items()))
+                cache_key = (
+                    func_name, args, items,
+                    tuple(map(type, args)), tuple(type(value) for _, value in items)
+                )
+            else:
+                cache_key = f"{func_name}_{create_cache_key(*args, **kwargs)}"
             
             # Try to get from cache
-            result = cache_provider.get(cache_key)
+            result = get(cache_key)
             if result is not None:
-                return result
+                return None if result is _CACHED_NONE else result
             
             # Execute function and cache result
             result = func(*args, **kwargs)
-            cache_provider.set(cache_key, result, ttl)
+            set_(cache_key, _CACHED_NONE if result is None else result, ttl)
             return result
         
         return wrapper
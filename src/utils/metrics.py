@@ -3,69 +3,189 @@ Metrics collection utilities for performance monitoring.
 """
 
 import time
-from typing import Dict, Any, Optional
-from datetime import datetime
-from collections import defaultdict, deque
+from typing import Dict, Any, Iterable, Optional
+from array import array
+from collections import Counter, deque
 import threading
 
 from src.core.logging import LoggerMixin
 from src.interfaces.base import MetricsCollector
 
 
+class _TimingRing:
+    """Fixed-size ring of float durations keeping the most recent samples."""
+    __slots__ = ('values', 'head', 'count')
+    
+    def __init__(self, size: int):
+        self.values = array('d', bytes(8 * size))
+        self.head = 0
+        self.count = 0
+    
+    def append(self, duration: float) -> None:
+        values = self.values
+        values[self.head] = duration
+        self.head = (self.head + 1) % len(values)
+        if self.count < len(values):
+            self.count += 1
+    
+    def window(self) -> array:
+        """Copy the filled part of the ring (order is irrelevant to the stats)."""
+        return self.values[:self.count]
+
+
 class InMemoryMetricsCollector(MetricsCollector, LoggerMixin):
     """In-memory metrics collector for development and testing."""
     
-    def __init__(self, max_history: int = 1000):
+    def __init__(self, max_history: int = 1000, operations: Iterable[str] = ()):
         self.max_history = max_history
-        self.counters = defaultdict(int)
         self.gauges = {}
-        self.timings = defaultdict(lambda: deque(maxlen=max_history))
-        self.lock = threading.Lock()
+        # Counts folded in from threads that have exited
+        self.counters: Counter = Counter()
+        self._thread_counters = []
+        self._counters_lock = threading.Lock()
+        # Rings for known operations are allocated up front
+        self.timings: Dict[str, _TimingRing] = {
+            operation: _TimingRing(max_history) for operation in operations
+        }
+        # Pre-aggregated timings: operation -> [total, count, min, max]
+        self.timing_aggregates: Dict[str, list] = {}
+        self._local = threading.local()
+        self._buffers = []
+        self._drain_lock = threading.Lock()
     
     def record_processing_time(self, operation: str, duration: float) -> None:
         """Record processing time for an operation."""
-        with self.lock:
-            self.timings[operation].append({
-                'duration': duration,
-                'timestamp': datetime.now()
-            })
+        try:
+            buffer = self._local.timings
+        except AttributeError:
+            buffer = self._register_buffer()
+        # deque.append is atomic, so recording never takes a lock
+        buffer.append((operation, duration))
+        if len(buffer) >= self.max_history:
+            self._drain_timings()
+    
+    def _register_buffer(self) -> deque:
+        """Create the calling thread's timing buffer."""
+        buffer = self._local.timings = deque()
+        with self._drain_lock:
+            self._buffers.append((threading.current_thread(), buffer))
+        return buffer
+    
+    def _drain_timings(self) -> None:
+        """Move buffered samples from every thread into the bounded history."""
+        timings = self.timings
+        with self._drain_lock:
+            live = []
+            for thread, buffer in self._buffers:
+                # popleft is safe against the owning thread appending concurrently
+                while buffer:
+                    operation, duration = buffer.popleft()
+                    ring = timings.get(operation)
+                    if ring is None:
+                        ring = timings[operation] = self._new_ring(operation)
+                    ring.append(duration)
+                if thread.is_alive():
+                    live.append((thread, buffer))
+            self._buffers = live
+    
+    def record_timing_aggregate(self, operation: str, total: float, count: int,
+                                minimum: float, maximum: float) -> None:
+        """Record timings that were already aggregated by the caller."""
+        with self._drain_lock:
+            aggregate = self.timing_aggregates.get(operation)
+            if aggregate is None:
+                self.timing_aggregates[operation] = [total, count, minimum, maximum]
+                return
+            aggregate[0] += total
+            aggregate[1] += count
+            aggregate[2] = min(aggregate[2], minimum)
+            aggregate[3] = max(aggregate[3], maximum)
+    
+    def _new_ring(self, operation: str) -> _TimingRing:
+        """Allocate history for an operation not registered at construction."""
+        self.logger.debug(f"Allocating timing history for unregistered operation '{operation}'")
+        return _TimingRing(self.max_history)
     
     def increment_counter(self, metric: str, tags: Dict[str, str] = None) -> None:
         """Increment a counter metric."""
-        with self.lock:
-            key = self._create_metric_key(metric, tags)
-            self.counters[key] += 1
+        key = self._create_metric_key(metric, tags)
+        try:
+            counts = self._local.counters
+        except AttributeError:
+            counts = self._register_counters()
+        # Only the owning thread writes its Counter, so the += needs no lock
+        counts[key] += 1
+    
+    def _register_counters(self) -> Counter:
+        """Create the calling thread's counter batch."""
+        counts = self._local.counters = Counter()
+        with self._counters_lock:
+            self._thread_counters.append((threading.current_thread(), counts))
+        return counts
+    
+    def _merge_counters(self) -> Dict[str, int]:
+        """Sum the shared counts with every thread's batch."""
+        with self._counters_lock:
+            live = []
+            for thread, counts in self._thread_counters:
+                if thread.is_alive():
+                    live.append((thread, counts))
+                else:
+                    # The owner is gone, so its batch can be folded in for good
+                    self.counters.update(counts)
+            self._thread_counters = live
+            merged = Counter(self.counters)
+            for _, counts in live:
+                # dict(...) copies in one C call, consistent against the owner's writes
+                merged.update(dict(counts))
+        return dict(merged)
     
     def record_gauge(self, metric: str, value: float, tags: Dict[str, str] = None) -> None:
         """Record a gauge metric."""
-        with self.lock:
-            key = self._create_metric_key(metric, tags)
-            self.gauges[key] = {
-                'value': value,
-                'timestamp': datetime.now()
-            }
+        key = self._create_metric_key(metric, tags)
+        # A single dict store is atomic; the latest write wins
+        self.gauges[key] = (value, time.time())
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary of collected metrics."""
-        with self.lock:
-            summary = {
-                'counters': dict(self.counters),
-                'gauges': {k: v['value'] for k, v in self.gauges.items()},
-                'timing_stats': {}
+        summary = {
+            'counters': self._merge_counters(),
+            'gauges': {k: value for k, (value, _) in self.gauges.copy().items()},
+            'timing_stats': {}
+        }
+        
+        self._drain_timings()
+        # Only copy under the lock; statistics are computed after releasing it
+        with self._drain_lock:
+            windows = [(operation, ring.window()) for operation, ring in self.timings.items() if ring.count]
+            aggregates = [(operation, tuple(aggregate)) for operation, aggregate in self.timing_aggregates.items()]
+        
+        # Calculate timing statistics
+        timing_stats = summary['timing_stats']
+        for operation, durations in windows:
+            timing_stats[operation] = {
+                'count': len(durations),
+                'avg': sum(durations) / len(durations),
+                'min': min(durations),
+                'max': max(durations)
             }
-            
-            # Calculate timing statistics
-            for operation, timings in self.timings.items():
-                if timings:
-                    durations = [t['duration'] for t in timings]
-                    summary['timing_stats'][operation] = {
-                        'count': len(durations),
-                        'avg': sum(durations) / len(durations),
-                        'min': min(durations),
-                        'max': max(durations)
-                    }
-            
-            return summary
+        
+        # Fold pre-aggregated timings into any samples for the same operation
+        for operation, (total, count, minimum, maximum) in aggregates:
+            stats = timing_stats.get(operation)
+            if stats is not None:
+                total += stats['avg'] * stats['count']
+                count += stats['count']
+                minimum = min(minimum, stats['min'])
+                maximum = max(maximum, stats['max'])
+            timing_stats[operation] = {
+                'count': count,
+                'avg': total / count,
+                'min': minimum,
+                'max': maximum
+            }
+        
+        return summary
     
     def _create_metric_key(self, metric: str, tags: Optional[Dict[str, str]]) -> str:
         """Create a metric key with tags."""
@@ -94,6 +214,33 @@ class PerformanceTimer:
             self.metrics_collector.record_processing_time(self.operation, duration)
 
 
+class AggregatingTimer:
+    """Accumulates per-operation timings locally and flushes them to a collector in bulk."""
+    
+    def __init__(self):
+        # operation -> [total, count, min, max]
+        self.buckets: Dict[str, list] = {}
+    
+    def add(self, operation: str, duration: float) -> None:
+        """Add a duration to an operation's bucket."""
+        bucket = self.buckets.get(operation)
+        if bucket is None:
+            self.buckets[operation] = [duration, 1, duration, duration]
+            return
+        bucket[0] += duration
+        bucket[1] += 1
+        if duration < bucket[2]:
+            bucket[2] = duration
+        if duration > bucket[3]:
+            bucket[3] = duration
+    
+    def flush_into(self, metrics_collector: InMemoryMetricsCollector) -> None:
+        """Hand each operation's total, count, min and max to the collector and reset the buckets."""
+        for operation, (total, count, minimum, maximum) in self.buckets.items():
+            metrics_collector.record_timing_aggregate(operation, total, count, minimum, maximum)
+        self.buckets.clear()
+
+
 def timed_operation(metrics_collector: MetricsCollector, operation_name: str = None):
     """Decorator for timing function execution."""
     def decorator(func):
@@ -11,14 +11,14 @@ This is the n-1 state - only contracts, abstractions, and behavioral definitions
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 
 # ============================================================================
 # Core Data Structures
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Statement:
     """A natural language statement expressing intent or requirements."""
     content: str
@@ -28,7 +28,7 @@ class Statement:
     statement_type: str  # functional, constraint, business_logic, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """A collection of statements forming a complete specification."""
     statements: List[Statement]
@@ -36,7 +36,7 @@ class Conversation:
     conversation_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Requirements:
     """Extracted requirements from conversational analysis."""
     functional: List[str]
@@ -46,7 +46,7 @@ class Requirements:
     preferences: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArchitecturalComponent:
     """A component in the system architecture."""
     name: str
@@ -56,7 +56,7 @@ class ArchitecturalComponent:
     constraints: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Architecture:
     """Complete system architecture specification."""
     components: List[ArchitecturalComponent]
@@ -66,7 +66,7 @@ class Architecture:
     quality_attributes: Dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class AbstractModel:
     """Language-agnostic abstract model."""
     interfaces: Dict[str, str]  # language -> interface_code
@@ -75,7 +75,7 @@ class AbstractModel:
     invariants: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class RunningSystem:
     """A materialized, executing system."""
     deployment_info: Dict[str, Any]
@@ -84,15 +84,20 @@ class RunningSystem:
     status: str
 
 
-class ArchitecturalPattern(Enum):
-    """Known architectural patterns."""
-    MICROSERVICES = "microservices"
-    EVENT_DRIVEN = "event_driven"
-    LAYERED = "layered"
-    HEXAGONAL = "hexagonal"
-    CQRS = "cqrs"
-    SAGA = "saga"
-    CIRCUIT_BREAKER = "circuit_breaker"
+class ArchitecturalPattern(IntEnum):
+    """Known architectural patterns (int-valued for cheap compare and hash)."""
+    MICROSERVICES = 1
+    EVENT_DRIVEN = 2
+    LAYERED = 3
+    HEXAGONAL = 4
+    CQRS = 5
+    SAGA = 6
+    CIRCUIT_BREAKER = 7
+    
+    @property
+    def label(self) -> str:
+        """Get the pattern's string identifier, e.g. ``"event_driven"``."""
+        return self.name.lower()
 
 
 # ============================================================================
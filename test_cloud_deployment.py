@@ -5,15 +5,138 @@ Tests the cloud deployment functionality of the Statement-to-Reality System
 """
 
 import asyncio
+import logging
 import os
+import sys
 import tempfile
 import shutil
+from itertools import islice
 from pathlib import Path
-import json
 
 from multi_language_generator import ProductionMultiLanguageGenerator, create_multi_language_generator
 from cloud_deployment import ProductionCloudDeployment, create_cloud_deployment_engine, DeploymentProvider
 from statement_reality_system import Environment, ResourceConstraints, Architecture, ArchitecturalComponent
+from tests.helpers import write_generated_files
+
+
+logger = logging.getLogger(__name__)
+
+def _deploy_concurrency():
+    """Read DEPLOY_CONCURRENCY from the environment, clamped to at least 1"""
+    raw = os.environ.get("DEPLOY_CONCURRENCY")
+    if raw is None:
+        return min(8, (os.cpu_count() or 1) * 2)
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        raise ValueError(f"DEPLOY_CONCURRENCY must be an integer, got {raw!r}") from None
+
+
+# Maximum concurrent deployment config generations (override with DEPLOY_CONCURRENCY)
+DEPLOY_CONCURRENCY = _deploy_concurrency()
+
+
+# Test architecture shared by every generated application (read-only during codegen)
+_SHARED_ARCHITECTURE = Architecture(
+    components=[
+        ArchitecturalComponent(
+            name="API",
+            responsibilities=["Handle HTTP requests", "Route endpoints"],
+            interfaces=["get", "post", "put", "delete"],
+            dependencies=[],
+            constraints={}
+        ),
+        ArchitecturalComponent(
+            name="Service",
+            responsibilities=["Business logic", "Data processing"],
+            interfaces=["process", "validate"],
+            dependencies=["API"],
+            constraints={}
+        ),
+        ArchitecturalComponent(
+            name="Storage",
+            responsibilities=["Data persistence", "Query handling"],
+            interfaces=["save", "load", "query"],
+            dependencies=["Service"],
+            constraints={}
+        )
+    ],
+    patterns=["REST API", "Layered Architecture"],
+    relationships={"API": ["Service"], "Service": ["Storage"]},
+    constraints={},
+    quality_attributes={"performance": "high", "scalability": "medium"}
+)
+
+
+def _static_host_check(provider, language, config_files):
+    """Readiness check for static/serverless hosts (Vercel, Netlify)"""
+    if language in ("javascript", "typescript"):
+        if "package.json" not in config_files:
+            return False, f"⚠ Missing package.json for {provider}"
+        return True, None
+    return True, f"ℹ {language} apps may need custom build configuration for {provider}"
+
+
+def _container_host_check(provider, language, config_files):
+    """Readiness check for container hosts (Railway, Render)"""
+    if "Dockerfile" not in config_files and language not in ("python", "rust", "go"):
+        return True, f"⚠ May need Dockerfile for {provider}"
+    return True, None
+
+
+# Provider -> readiness check returning (deployment_ready, message)
+PROVIDER_RULES = {
+    "vercel": _static_host_check,
+    "netlify": _static_host_check,
+    "railway": _container_host_check,
+    "render": _container_host_check,
+}
+
+
+# Runtime -> recommended providers, with a fallback for other runtimes
+RUNTIME_TO_PROVIDERS = {
+    "serverless": ("vercel", "netlify", "aws_lambda"),
+    "container": ("railway", "render", "aws_ecs", "gcp_cloud_run"),
+}
+DEFAULT_PROVIDERS = ("aws_ecs", "gcp_cloud_run", "azure_container_instances")
+
+
+# Environment scenarios exercised by test_environment_detection
+_ENV_SCENARIOS = (
+    Environment(
+        platform="web",
+        runtime="serverless", 
+        constraints=ResourceConstraints(
+            max_memory_mb=128,
+            max_cpu_cores=1,
+            max_storage_gb=0.1,
+            budget_limit=5.0
+        ),
+        capabilities=["http_server"]
+    ),
+    Environment(
+        platform="web",
+        runtime="container",
+        constraints=ResourceConstraints(
+            max_memory_mb=1024,
+            max_cpu_cores=2,
+            max_storage_gb=5.0,
+            budget_limit=50.0
+        ),
+        capabilities=["http_server", "database", "file_storage"]
+    ),
+    Environment(
+        platform="api",
+        runtime="microservice",
+        constraints=ResourceConstraints(
+            max_memory_mb=2048,
+            max_cpu_cores=4,
+            max_storage_gb=10.0,
+            budget_limit=100.0
+        ),
+        capabilities=["http_server", "database", "cache", "queue"]
+    )
+)
 
 
 class CloudDeploymentTester:
@@ -26,7 +149,9 @@ class CloudDeploymentTester:
         
     async def setup_test_environment(self):
         """Setup temporary test environment"""
-        self.test_dir = tempfile.mkdtemp(prefix="statement_reality_test_")
+        # Prefer tmpfs so generated files never touch disk; fall back to the default temp dir
+        shm_dir = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+        self.test_dir = tempfile.mkdtemp(prefix="statement_reality_test_", dir=shm_dir)
         print(f"Created test directory: {self.test_dir}")
         
     async def cleanup_test_environment(self):
@@ -35,6 +160,28 @@ class CloudDeploymentTester:
             shutil.rmtree(self.test_dir)
             print(f"Cleaned up test directory: {self.test_dir}")
     
+    async def _generate_one(self, test_case):
+        """Generate one application and write its files off the event loop"""
+        # Generate application code (microseconds, so in-line)
+        generated_files = self.generator.generate_code(
+            _SHARED_ARCHITECTURE, 
+            test_case["language"], 
+            test_case["framework"]
+        )
+        
+        if not generated_files:
+            return None
+        
+        # Create output directory and save files
+        output_dir = os.path.join(self.test_dir, test_case["name"].lower().replace(" ", "_"))
+        await asyncio.to_thread(write_generated_files, output_dir, generated_files)
+        
+        return {
+            "test_case": test_case,
+            "files": generated_files,
+            "path": output_dir
+        }
+    
     async def test_application_generation(self):
         """Test generating applications in multiple languages"""
         print("\n=== Testing Application Generation ===")
@@ -61,133 +208,109 @@ class CloudDeploymentTester:
             }
         ]
         
+        # Generate all applications concurrently; report in test-case order
+        results = await asyncio.gather(
+            *(self._generate_one(test_case) for test_case in test_cases),
+            return_exceptions=True
+        )
+        
         generated_apps = []
         
-        for test_case in test_cases:
+        for test_case, result in zip(test_cases, results):
             print(f"\nGenerating {test_case['name']}...")
             
-            # Create test architecture for the application
-            architecture = Architecture(
-                components=[
-                    ArchitecturalComponent(
-                        name="API",
-                        responsibilities=["Handle HTTP requests", "Route endpoints"],
-                        interfaces=["get", "post", "put", "delete"],
-                        dependencies=[],
-                        constraints={}
-                    ),
-                    ArchitecturalComponent(
-                        name="Service",
-                        responsibilities=["Business logic", "Data processing"],
-                        interfaces=["process", "validate"],
-                        dependencies=["API"],
-                        constraints={}
-                    ),
-                    ArchitecturalComponent(
-                        name="Storage",
-                        responsibilities=["Data persistence", "Query handling"],
-                        interfaces=["save", "load", "query"],
-                        dependencies=["Service"],
-                        constraints={}
-                    )
-                ],
-                patterns=["REST API", "Layered Architecture"],
-                relationships={"API": ["Service"], "Service": ["Storage"]},
-                constraints={},
-                quality_attributes={"performance": "high", "scalability": "medium"}
-            )
-            
-            try:
-                # Generate application code
-                generated_files = self.generator.generate_code(
-                    architecture, 
-                    test_case["language"], 
-                    test_case["framework"]
-                )
-                
-                if generated_files:
-                    print(f"✓ Successfully generated {test_case['name']}")
-                    print(f"  Files created: {len(generated_files)}")
-                    
-                    # Create output directory and save files
-                    output_dir = os.path.join(self.test_dir, test_case["name"].lower().replace(" ", "_"))
-                    os.makedirs(output_dir, exist_ok=True)
-                    
-                    # Write generated files to disk
-                    for filename, content in generated_files.items():
-                        file_path = os.path.join(output_dir, filename)
-                        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                        with open(file_path, 'w') as f:
-                            f.write(content)
-                    
-                    generated_apps.append({
-                        "test_case": test_case,
-                        "files": generated_files,
-                        "path": output_dir
-                    })
-                else:
-                    print(f"✗ No files generated for {test_case['name']}")
-                    
-            except Exception as e:
-                print(f"✗ Exception generating {test_case['name']}: {e}")
+            if isinstance(result, Exception):
+                print(f"✗ Exception generating {test_case['name']}: {result}")
+            elif result:
+                print(f"✓ Successfully generated {test_case['name']}")
+                print(f"  Files created: {len(result['files'])}")
+                generated_apps.append(result)
+            else:
+                print(f"✗ No files generated for {test_case['name']}")
         
         return generated_apps
     
+    def _write_config_files(self, app_path, config_sets):
+        """Write provider config files into an app directory, in provider order"""
+        # Providers share filenames (e.g. Dockerfile); merge so each file is written
+        # once, with the last provider's content as before
+        merged = {}
+        for config_files in config_sets:
+            merged.update(config_files)
+        write_generated_files(app_path, merged)
+    
     async def test_deployment_configuration(self, generated_apps):
         """Test deployment configuration generation"""
         print("\n=== Testing Deployment Configuration ===")
         
-        deployment_configs = []
+        # Test different cloud providers
+        providers = [
+            DeploymentProvider.VERCEL,
+            DeploymentProvider.NETLIFY,
+            DeploymentProvider.RAILWAY,
+            DeploymentProvider.RENDER
+        ]
+        environment_variables = {
+            "NODE_ENV": "production",
+            "PORT": "3000"
+        }
         
+        jobs = []
         for app in generated_apps:
-            test_case = app["test_case"]
-            app_path = app["path"]
-            
-            print(f"\nConfiguring deployment for {test_case['name']}...")
-            
-            # Test different cloud providers
-            providers = [
-                DeploymentProvider.VERCEL,
-                DeploymentProvider.NETLIFY,
-                DeploymentProvider.RAILWAY,
-                DeploymentProvider.RENDER
-            ]
+            slug = app["test_case"]["name"].lower().replace(" ", "-")
+            jobs.extend((app, provider, f"{slug}-{provider.value}") for provider in providers)
+        
+        # Generate every app x provider configuration concurrently, bounded so the
+        # deployment engine never sees more than DEPLOY_CONCURRENCY calls at once
+        semaphore = asyncio.Semaphore(DEPLOY_CONCURRENCY)
+        
+        async def generate(app, provider, app_name):
+            async with semaphore:
+                return await self.deployment_engine.generate_deployment_files(
+                    app_name=app_name,
+                    source_path=app["path"],
+                    provider=provider,
+                    environment_variables=environment_variables
+                )
+        
+        results = await asyncio.gather(
+            *(generate(app, provider, app_name) for app, provider, app_name in jobs),
+            return_exceptions=True
+        )
+        
+        deployment_configs = []
+        current_app = None
+        
+        for (app, provider, app_name), config_files in zip(jobs, results):
+            if app is not current_app:
+                current_app = app
+                print(f"\nConfiguring deployment for {app['test_case']['name']}...")
             
-            for provider in providers:
-                try:
-                    app_name = f"{test_case['name'].lower().replace(' ', '-')}-{provider.value}"
-                    
-                    # Test deployment configuration generation
-                    config_files = await self.deployment_engine.generate_deployment_files(
-                        app_name=app_name,
-                        source_path=app_path,
-                        provider=provider,
-                        environment_variables={
-                            "NODE_ENV": "production",
-                            "PORT": "3000"
-                        }
-                    )
-                    
-                    if config_files:
-                        print(f"  ✓ Generated {provider.value} config files: {list(config_files.keys())}")
-                        
-                        # Write config files to app directory
-                        for filename, content in config_files.items():
-                            config_path = os.path.join(app_path, filename)
-                            with open(config_path, 'w') as f:
-                                f.write(content)
-                        
-                        deployment_configs.append({
-                            "app": app,
-                            "provider": provider,
-                            "app_name": app_name,
-                            "config_files": config_files
-                        })
-                    else:
-                        print(f"  ✗ Failed to generate {provider.value} config")
-                        
-                except Exception as e:
-                    print(f"  ✗ Exception with {provider.value}: {e}")
+            if isinstance(config_files, Exception):
+                print(f"  ✗ Exception with {provider.value}: {config_files}")
+            elif config_files:
+                print(f"  ✓ Generated {provider.value} config files: {list(config_files.keys())}")
+                deployment_configs.append({
+                    "app": app,
+                    "provider": provider,
+                    "app_name": app_name,
+                    "config_files": config_files,
+                    "config_file_names": tuple(config_files),
+                    "config_file_set": frozenset(config_files)
+                })
+            else:
+                print(f"  ✗ Failed to generate {provider.value} config")
+        
+        # Write config files to app directories; apps are written concurrently,
+        # providers in order so shared filenames keep the last provider's content
+        await asyncio.gather(*(
+            asyncio.to_thread(
+                self._write_config_files,
+                app["path"],
+                [config["config_files"] for config in deployment_configs if config["app"] is app]
+            )
+            for app in generated_apps
+        ))
         
         return deployment_configs
     
@@ -195,7 +318,7 @@ class CloudDeploymentTester:
         """Test deployment simulation (without actual deployment)"""
         print("\n=== Testing Deployment Simulation ===")
         
-        for config in deployment_configs[:6]:  # Test first 6 configurations
+        for config in islice(deployment_configs, 6):  # Test first 6 configurations
             app_name = config["app_name"]
             provider = config["provider"].value
             app_path = config["app"]["path"]
@@ -214,30 +337,21 @@ class CloudDeploymentTester:
                 print(f"    ✓ Application path exists: {app_path}")
                 
                 # Check for generated files
-                generated_files = list(config["app"]["files"].keys())
-                print(f"    ✓ Generated files: {', '.join(generated_files)}")
+                print(f"    ✓ Generated files: {', '.join(config['app']['files'])}")
                 
                 # Check for deployment configuration files
-                config_files = list(config["config_files"].keys())
-                print(f"    ✓ Deployment config files: {', '.join(config_files)}")
+                print(f"    ✓ Deployment config files: {', '.join(config['config_file_names'])}")
                 
                 # Simulate deployment readiness check
                 language = config["app"]["test_case"]["language"]
                 framework = config["app"]["test_case"]["framework"]
                 
-                deployment_ready = True
-                
-                if provider in ["vercel", "netlify"]:
-                    if language in ["javascript", "typescript"]:
-                        if "package.json" not in config_files:
-                            print(f"    ⚠ Missing package.json for {provider}")
-                            deployment_ready = False
-                    else:
-                        print(f"    ℹ {language} apps may need custom build configuration for {provider}")
-                
-                elif provider in ["railway", "render"]:
-                    if "Dockerfile" not in config_files and language not in ["python", "rust", "go"]:
-                        print(f"    ⚠ May need Dockerfile for {provider}")
+                rule = PROVIDER_RULES.get(provider)
+                deployment_ready, message = (
+                    rule(provider, language, config["config_file_set"]) if rule else (True, None)
+                )
+                if message:
+                    print(f"    {message}")
                 
                 if deployment_ready:
                     print(f"  ✅ Application ready for deployment to {provider}")
@@ -252,72 +366,41 @@ class CloudDeploymentTester:
         """Test environment detection and optimization"""
         print("\n=== Testing Environment Detection ===")
         
-        # Test different environment scenarios
-        environments = [
-            Environment(
-                platform="web",
-                runtime="serverless", 
-                constraints=ResourceConstraints(
-                    max_memory_mb=128,
-                    max_cpu_cores=1,
-                    max_storage_gb=0.1,
-                    budget_limit=5.0
-                ),
-                capabilities=["http_server"]
-            ),
-            Environment(
-                platform="web",
-                runtime="container",
-                constraints=ResourceConstraints(
-                    max_memory_mb=1024,
-                    max_cpu_cores=2,
-                    max_storage_gb=5.0,
-                    budget_limit=50.0
-                ),
-                capabilities=["http_server", "database", "file_storage"]
-            ),
-            Environment(
-                platform="api",
-                runtime="microservice",
-                constraints=ResourceConstraints(
-                    max_memory_mb=2048,
-                    max_cpu_cores=4,
-                    max_storage_gb=10.0,
-                    budget_limit=100.0
-                ),
-                capabilities=["http_server", "database", "cache", "queue"]
-            )
-        ]
-        
-        for i, env in enumerate(environments):
-            print(f"\nEnvironment {i+1}: {env.platform}/{env.runtime}")
-            print(f"  Memory: {env.constraints.max_memory_mb}MB")
-            print(f"  CPU: {env.constraints.max_cpu_cores} cores")
-            print(f"  Storage: {env.constraints.max_storage_gb}GB")
-            print(f"  Budget: ${env.constraints.budget_limit}")
-            print(f"  Capabilities: {', '.join(env.capabilities)}")
+        for i, env in enumerate(_ENV_SCENARIOS):
+            constraints = env.constraints
             
             # Determine optimal deployment strategy
-            if env.runtime == "serverless":
-                recommended_providers = ["vercel", "netlify", "aws_lambda"]
-            elif env.runtime == "container":
-                recommended_providers = ["railway", "render", "aws_ecs", "gcp_cloud_run"]
-            else:
-                recommended_providers = ["aws_ecs", "gcp_cloud_run", "azure_container_instances"]
+            recommended_providers = RUNTIME_TO_PROVIDERS.get(env.runtime, DEFAULT_PROVIDERS)
             
-            print(f"  Recommended providers: {', '.join(recommended_providers)}")
+            # One write per environment instead of one print() per line
+            print("\n".join((
+                f"\nEnvironment {i+1}: {env.platform}/{env.runtime}",
+                f"  Memory: {constraints.max_memory_mb}MB",
+                f"  CPU: {constraints.max_cpu_cores} cores",
+                f"  Storage: {constraints.max_storage_gb}GB",
+                f"  Budget: ${constraints.budget_limit}",
+                f"  Capabilities: {', '.join(env.capabilities)}",
+                f"  Recommended providers: {', '.join(recommended_providers)}"
+            )))
     
     async def run_comprehensive_test(self):
         """Run comprehensive test suite"""
+        # Block-buffer stdout for the run and flush once per phase instead of per line
+        line_buffering = getattr(sys.stdout, "line_buffering", False)
+        if line_buffering:
+            sys.stdout.reconfigure(line_buffering=False)
+        
         print("🚀 Starting Statement-to-Reality Cloud Deployment Test Suite")
         print("=" * 70)
         
         try:
             # Setup
             await self.setup_test_environment()
+            sys.stdout.flush()
             
             # Test 1: Application Generation
             generated_apps = await self.test_application_generation()
+            sys.stdout.flush()
             
             if not generated_apps:
                 print("\n❌ No applications generated successfully. Skipping deployment tests.")
@@ -325,9 +408,11 @@ class CloudDeploymentTester:
             
             # Test 2: Deployment Configuration
             deployment_configs = await self.test_deployment_configuration(generated_apps)
+            sys.stdout.flush()
             
             # Test 3: Deployment Simulation
             await self.test_deployment_simulation(deployment_configs)
+            sys.stdout.flush()
             
             # Test 4: Environment Detection
             await self.test_environment_detection()
@@ -339,12 +424,16 @@ class CloudDeploymentTester:
             
         except Exception as e:
             print(f"\n❌ Test suite failed with error: {e}")
-            import traceback
-            traceback.print_exc()
+            sys.stdout.flush()
+            logger.exception("Cloud deployment test suite failed")
             
         finally:
             # Cleanup
             await self.cleanup_test_environment()
+            if line_buffering:
+                sys.stdout.reconfigure(line_buffering=True)
+            else:
+                sys.stdout.flush()
 
 
 async def main():
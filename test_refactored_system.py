@@ -9,8 +9,13 @@ the refactored architecture works correctly.
 import sys
 import os
 import asyncio
+import tempfile
+import time
+from collections import Counter
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, Any
+from unittest.mock import patch
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -24,16 +29,29 @@ from src.core.exceptions import *
 from src.services.conversation_service import ConversationService, EnhancedConversationalParser
 from src.services.architecture_service import ArchitectureService, EnhancedArchitecturalInference
 from src.services.code_generation_service import CodeGenerationService, EnhancedMultiLanguageGenerator
-from src.utils.cache import MemoryCache, create_cache_key
-from src.utils.metrics import InMemoryMetricsCollector, PerformanceTimer
+from src.utils.cache import MemoryCache, FileCache, cached, create_cache_key
+from src.utils.metrics import InMemoryMetricsCollector, AggregatingTimer
 
 
 class TestRunner:
     """Comprehensive test runner for the refactored system."""
     
+    # (display name, method name, timing metric key)
+    TEST_SUITES = (
+        ("Core Models", "test_core_models", "test_core_models"),
+        ("Configuration", "test_configuration", "test_configuration"),
+        ("Caching System", "test_caching", "test_caching_system"),
+        ("Metrics Collection", "test_metrics", "test_metrics_collection"),
+        ("Conversation Service", "test_conversation_service", "test_conversation_service"),
+        ("Architecture Service", "test_architecture_service", "test_architecture_service"),
+        ("Code Generation Service", "test_code_generation_service", "test_code_generation_service"),
+        ("Integration Tests", "test_integration", "test_integration_tests"),
+    )
+    
     def __init__(self):
         self.test_results = []
         self.metrics = InMemoryMetricsCollector()
+        self.timings = AggregatingTimer()
         
         # Setup test configuration
         test_config = SystemConfig()
@@ -41,27 +59,33 @@ class TestRunner:
         test_config.enable_caching = True
         set_config(test_config)
     
+    # Engines are shared by the service and integration suites and built on first use
+    @cached_property
+    def parser(self) -> EnhancedConversationalParser:
+        return EnhancedConversationalParser()
+    
+    @cached_property
+    def inference_engine(self) -> EnhancedArchitecturalInference:
+        return EnhancedArchitecturalInference()
+    
+    @cached_property
+    def generator(self) -> EnhancedMultiLanguageGenerator:
+        return EnhancedMultiLanguageGenerator()
+    
     def run_all_tests(self):
         """Run all test suites."""
         print("🧪 Starting Refactored System Test Suite")
         print("=" * 60)
         
-        test_suites = [
-            ("Core Models", self.test_core_models),
-            ("Configuration", self.test_configuration),
-            ("Caching System", self.test_caching),
-            ("Metrics Collection", self.test_metrics),
-            ("Conversation Service", self.test_conversation_service),
-            ("Architecture Service", self.test_architecture_service),
-            ("Code Generation Service", self.test_code_generation_service),
-            ("Integration Tests", self.test_integration)
-        ]
-        
-        for suite_name, test_func in test_suites:
+        for suite_name, method_name, metric_key in self.TEST_SUITES:
+            test_func = getattr(self, method_name)
             print(f"\n📋 Running {suite_name} Tests...")
             try:
-                with PerformanceTimer(self.metrics, f"test_{suite_name.lower().replace(' ', '_')}"):
+                start = time.perf_counter()
+                try:
                     test_func()
+                finally:
+                    self.timings.add(metric_key, time.perf_counter() - start)
                 self._record_result(suite_name, "PASSED", None)
                 print(f"✅ {suite_name} Tests: PASSED")
             except Exception as e:
@@ -157,11 +181,54 @@ class TestRunner:
         assert key1 == key2  # Same inputs should generate same key
         assert key1 != key3  # Different inputs should generate different keys
         
+        # Equal mappings and sets key identically regardless of insertion order
+        assert create_cache_key({"a": 1, "b": 2}) == create_cache_key({"b": 2, "a": 1})
+        assert create_cache_key([{"x": {"a", "b"}}], opts={"k": 1, "j": 2}) == \
+            create_cache_key([{"x": {"b", "a"}}], opts={"j": 2, "k": 1})
+        assert create_cache_key({"a": 1}) != create_cache_key([("a", 1)])
+        
         # Test deletion
         cache.delete("test_key")
         value = cache.get("test_key")
         assert value is None
         
+        # Entries with identical expiries and mixed key types must coexist
+        with patch("src.utils.cache.time.monotonic", return_value=time.monotonic()):
+            tied = MemoryCache(default_ttl=60)
+            tied.set(("f", (1,), ()), "tuple")
+            tied.set("f_key", "str")
+            tied.set(("f", ("a",), ()), "tuple2")
+            assert tied.get("f_key") == "str"
+            assert tied.get(("f", (1,), ())) == "tuple"
+        
+        # Equal-but-differently-typed arguments must not share a cached result
+        @cached(MemoryCache())
+        def describe(value, flag=0):
+            return f"{type(value).__name__}:{value}:{type(flag).__name__}"
+        
+        assert [describe(1), describe(True), describe(1.0)] == ["int:1:int", "bool:True:int", "float:1.0:int"]
+        assert describe(1, flag=1) != describe(1, flag=True)
+        
+        @cached(MemoryCache())
+        def nested(value):
+            return repr(value)
+        
+        assert [nested((1,)), nested((True,)), nested((1.0,))] == ["(1,)", "(True,)", "(1.0,)"]
+        
+        # File caches sharing a directory see each other's later writes
+        with tempfile.TemporaryDirectory() as cache_dir:
+            writer = FileCache(cache_dir)
+            reader = FileCache(cache_dir)
+            writer.set("shared", 42)
+            assert reader.get("shared") == 42
+            
+            # The opt-in negative cache still sees its own writes
+            local = FileCache(cache_dir, negative_cache=True)
+            assert local.get("shared") == 42
+            assert local.get("missing") is None
+            local.set("local", 7)
+            assert local.get("local") == 7
+        
         print("  ✓ Caching system working correctly")
     
     def test_metrics(self):
@@ -187,26 +254,36 @@ class TestRunner:
         assert summary["counters"]["test_counter"] == 2
         assert summary["gauges"]["test_gauge"] == 42.5
         
+        # Test aggregated timings keep their real count, min and max
+        timer = AggregatingTimer()
+        for duration in (1.0, 2.0, 6.0):
+            timer.add("test_operation", duration)
+        timer.flush_into(metrics)
+        stats = metrics.get_metrics_summary()["timing_stats"]["test_operation"]
+        assert stats["count"] == 4
+        assert (stats["min"], stats["max"]) == (1.0, 6.0)
+        
         print("  ✓ Metrics collection working correctly")
     
     def test_conversation_service(self):
         """Test conversation processing service."""
-        parser = EnhancedConversationalParser()
+        parser = self.parser
         service = ConversationService(parser)
         
         # Create test conversation
+        now = datetime.now()
         statements = [
             Statement(
                 content="Create a REST API for user management with authentication",
                 context={"domain": "web_development"},
-                timestamp=datetime.now(),
+                timestamp=now,
                 speaker="user",
                 statement_type=StatementType.FUNCTIONAL
             ),
             Statement(
                 content="The system should handle 1000 concurrent users",
                 context={"performance": True},
-                timestamp=datetime.now(),
+                timestamp=now,
                 speaker="user",
                 statement_type=StatementType.NON_FUNCTIONAL
             )
@@ -239,7 +316,7 @@ class TestRunner:
     
     def test_architecture_service(self):
         """Test architecture inference service."""
-        inference_engine = EnhancedArchitecturalInference()
+        inference_engine = self.inference_engine
         service = ArchitectureService(inference_engine)
         
         # Create test requirements
@@ -272,7 +349,7 @@ class TestRunner:
     
     def test_code_generation_service(self):
         """Test code generation service."""
-        generator = EnhancedMultiLanguageGenerator()
+        generator = self.generator
         service = CodeGenerationService(generator)
         
         # Create test architecture
@@ -322,28 +399,24 @@ class TestRunner:
     async def test_integration(self):
         """Test full system integration."""
         # Create services
-        parser = EnhancedConversationalParser()
-        conversation_service = ConversationService(parser)
-        
-        inference_engine = EnhancedArchitecturalInference()
-        architecture_service = ArchitectureService(inference_engine)
-        
-        generator = EnhancedMultiLanguageGenerator()
-        code_service = CodeGenerationService(generator)
+        conversation_service = ConversationService(self.parser)
+        architecture_service = ArchitectureService(self.inference_engine)
+        code_service = CodeGenerationService(self.generator)
         
         # Create test conversation
+        now = datetime.now()
         statements = [
             Statement(
                 content="Build a chat application with real-time messaging",
                 context={"type": "web_app"},
-                timestamp=datetime.now(),
+                timestamp=now,
                 speaker="user",
                 statement_type=StatementType.FUNCTIONAL
             ),
             Statement(
                 content="Support 500 concurrent users with low latency",
                 context={"performance": True},
-                timestamp=datetime.now(),
+                timestamp=now,
                 speaker="user",
                 statement_type=StatementType.NON_FUNCTIONAL
             )
@@ -382,12 +455,7 @@ class TestRunner:
     
     def _record_result(self, test_name: str, status: str, error: str):
         """Record test result."""
-        self.test_results.append({
-            "test": test_name,
-            "status": status,
-            "error": error,
-            "timestamp": datetime.now()
-        })
+        self.test_results.append((test_name, status, error))
     
     def _print_summary(self):
         """Print test summary."""
@@ -395,8 +463,8 @@ class TestRunner:
         print("📊 TEST SUMMARY")
         print("=" * 60)
         
-        passed = sum(1 for r in self.test_results if r["status"] == "PASSED")
-        failed = sum(1 for r in self.test_results if r["status"] == "FAILED")
+        tally = Counter(status for _, status, _ in self.test_results)
+        passed, failed = tally["PASSED"], tally["FAILED"]
         total = len(self.test_results)
         
         print(f"Total Tests: {total}")
@@ -406,11 +474,12 @@ class TestRunner:
         
         if failed > 0:
             print("\n🔍 FAILED TESTS:")
-            for result in self.test_results:
-                if result["status"] == "FAILED":
-                    print(f"  ❌ {result['test']}: {result['error']}")
+            for test_name, status, error in self.test_results:
+                if status == "FAILED":
+                    print(f"  ❌ {test_name}: {error}")
         
         # Print performance metrics
+        self.timings.flush_into(self.metrics)
         metrics_summary = self.metrics.get_metrics_summary()
         if metrics_summary.get("timing_stats"):
             print("\n⏱️  PERFORMANCE METRICS:")
@@ -8,14 +8,31 @@ import asyncio
 import os
 import tempfile
 import shutil
+from itertools import islice
 from pathlib import Path
 import json
 
+try:
+    import uvloop
+except ImportError:  # optional: fall back to the stdlib event loop
+    uvloop = None
+
 from multi_language_generator import create_multi_language_generator
+from tests.helpers import write_generated_files
 from cloud_deployment import create_cloud_deployment_engine, DeploymentConfig
 from statement_reality_system import Architecture, ArchitecturalComponent
 
 
+# (provider, language) -> ((filename, blocks deployment if missing), ...); "*" matches any language.
+# Container hosts can have a Dockerfile generated for them, so its absence is not blocking.
+_REQUIRED_FILES = {
+    **{(provider, language): (("package.json", True),)
+       for provider in ("vercel", "netlify") for language in ("javascript", "typescript")},
+    **{(provider, "python"): (("requirements.txt", False),) for provider in ("vercel", "netlify")},
+    **{(provider, "*"): (("Dockerfile", False),) for provider in ("aws", "gcp", "azure")},
+}
+
+
 class SystemIntegrationTester:
     """Complete system integration test suite"""
     
@@ -23,6 +40,8 @@ class SystemIntegrationTester:
         self.generator = create_multi_language_generator()
         self.deployment_engine = create_cloud_deployment_engine()
         self.test_dir = None
+        # Directories already created under test_dir (shared by the writer threads)
+        self._ensured = set()
         
     async def setup_test_environment(self):
         """Setup temporary test environment"""
@@ -32,8 +51,22 @@ class SystemIntegrationTester:
     async def cleanup_test_environment(self):
         """Cleanup test environment"""
         if self.test_dir and os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+            await asyncio.to_thread(shutil.rmtree, self.test_dir, ignore_errors=True)
             print(f"🧹 Cleaned up test directory: {self.test_dir}")
+        self._ensured.clear()
+    
+    async def _generate_one(self, architecture, language, framework):
+        """Generate one language's application and write it to disk off the event loop"""
+        # Generate code (microseconds per language, so in-line)
+        generated_files = self.generator.generate_code(architecture, language, framework)
+        
+        if not generated_files:
+            return None
+        
+        output_dir = os.path.join(self.test_dir, f"{language}_{framework}")
+        await asyncio.to_thread(write_generated_files, output_dir, generated_files, self._ensured)
+        
+        return generated_files, output_dir
     
     async def test_multi_language_generation(self):
         """Test multi-language code generation capabilities"""
@@ -80,43 +113,36 @@ class SystemIntegrationTester:
             ("cpp", "crow", "⚡ C++ Crow")
         ]
         
+        # Generate every language concurrently; report in test-case order
+        outcomes = await asyncio.gather(
+            *(
+                self._generate_one(architecture, language, framework)
+                for language, framework, _ in test_cases
+            ),
+            return_exceptions=True
+        )
+        
         generated_results = []
         
-        for language, framework, display_name in test_cases:
+        for (language, framework, display_name), outcome in zip(test_cases, outcomes):
             print(f"\n{display_name} Application Generation:")
             
-            try:
-                # Generate code
-                generated_files = self.generator.generate_code(architecture, language, framework)
+            if isinstance(outcome, Exception):
+                print(f"  ❌ Generation failed: {outcome}")
+            elif outcome:
+                generated_files, output_dir = outcome
+                print(f"  ✅ Generated {len(generated_files)} files")
+                print(f"  📁 Files: {', '.join(generated_files.keys())}")
                 
-                if generated_files:
-                    print(f"  ✅ Generated {len(generated_files)} files")
-                    
-                    # Create output directory
-                    output_dir = os.path.join(self.test_dir, f"{language}_{framework}")
-                    os.makedirs(output_dir, exist_ok=True)
-                    
-                    # Write files to disk
-                    for filename, content in generated_files.items():
-                        file_path = os.path.join(output_dir, filename)
-                        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                        with open(file_path, 'w') as f:
-                            f.write(content)
-                    
-                    print(f"  📁 Files: {', '.join(generated_files.keys())}")
-                    
-                    generated_results.append({
-                        "language": language,
-                        "framework": framework,
-                        "display_name": display_name,
-                        "files": generated_files,
-                        "path": output_dir
-                    })
-                else:
-                    print(f"  ❌ No files generated")
-                    
-            except Exception as e:
-                print(f"  ❌ Generation failed: {e}")
+                generated_results.append({
+                    "language": language,
+                    "framework": framework,
+                    "display_name": display_name,
+                    "files": generated_files,
+                    "path": output_dir
+                })
+            else:
+                print(f"  ❌ No files generated")
         
         return generated_results
     
@@ -164,7 +190,7 @@ class SystemIntegrationTester:
         """Test deployment simulation without actual deployment"""
         print("\n=== 🚀 Testing Deployment Simulation ===")
         
-        for config_item in deployment_configs[:6]:  # Test first 6 configurations
+        for config_item in islice(deployment_configs, 6):  # Test first 6 configurations
             result = config_item["result"]
             provider = config_item["provider"]
             config = config_item["config"]
@@ -181,22 +207,10 @@ class SystemIntegrationTester:
                 print(f"  📦 Validating {len(files)} files for {provider}")
                 
                 # Check deployment readiness
-                deployment_ready = True
-                missing_files = []
-                
-                if provider in ["vercel", "netlify"]:
-                    if language in ["javascript", "typescript"]:
-                        if "package.json" not in files:
-                            missing_files.append("package.json")
-                            deployment_ready = False
-                    elif language == "python":
-                        if "requirements.txt" not in files:
-                            missing_files.append("requirements.txt")
-                
-                elif provider in ["aws", "gcp", "azure"]:
-                    if "Dockerfile" not in files:
-                        missing_files.append("Dockerfile")
-                        # Don't mark as not ready since we can generate Dockerfile
+                required = _REQUIRED_FILES.get((provider, language)) or _REQUIRED_FILES.get((provider, "*"), ())
+                missing = [(filename, blocking) for filename, blocking in required if filename not in files]
+                missing_files = [filename for filename, _ in missing]
+                deployment_ready = not any(blocking for _, blocking in missing)
                 
                 if deployment_ready:
                     print(f"  ✅ Ready for deployment to {provider}")
@@ -222,13 +236,14 @@ class SystemIntegrationTester:
         print(f"☁️  Cloud Deployment Engine: {type(self.deployment_engine).__name__}")
         
         # Test architecture complexity handling
+        names = tuple(f"Component{i}" for i in range(10))
         complex_architecture = Architecture(
             components=[
-                ArchitecturalComponent(f"Component{i}", [f"responsibility{i}"], [f"interface{i}"], [], {})
-                for i in range(10)
+                ArchitecturalComponent(name, [f"responsibility{i}"], [f"interface{i}"], [], {})
+                for i, name in enumerate(names)
             ],
             patterns=["Microservices", "Event-Driven", "CQRS", "Saga Pattern"],
-            relationships={f"Component{i}": [f"Component{j}"] for i in range(5) for j in range(i+1, 10)},
+            relationships={names[i]: [names[j]] for i in range(5) for j in range(i+1, 10)},
             constraints={"distributed": True, "eventual_consistency": True},
             quality_attributes={"scalability": "extreme", "availability": "99.99%"}
         )
@@ -291,4 +306,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -0,0 +1,34 @@
+"""
+Shared helpers for the deployment test scripts.
+"""
+
+import os
+from typing import Dict, Optional, Set
+
+
+def write_generated_files(output_dir: str, files: Dict[str, str], created_dirs: Optional[Set[str]] = None) -> None:
+    """Write generated files under output_dir as UTF-8, creating each directory once.
+    
+    Pass the same created_dirs set across calls to skip directories that
+    earlier calls already created.
+    """
+    encoded = [
+        (os.path.join(output_dir, filename), content.encode("utf-8"))
+        for filename, content in files.items()
+    ]
+    if created_dirs is None:
+        created_dirs = set()
+    for directory in {os.path.dirname(path) for path, _ in encoded} | {output_dir}:
+        if directory not in created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            created_dirs.add(directory)
+    
+    # Raw os-level writes: no text codec or buffer layers per file
+    for path, data in encoded:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)